@@ -44,15 +44,22 @@ async def authenticate(email, password, token, *, host=None) -> Account:
 
 async def run_demo(email, password, token, *, host=None) -> None:
     """Run the demo asynchronously"""
+    # Eager tasks were added in Python 3.12
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     async with await authenticate(email, password, token, host=host) as account:
         print(f"The account with email {account.email} was authenticated")
 
         user = await account.get_user()
         print(f"User id: {user.user_id}")
 
-        for home_id, home_info in user.homes.items():
+        homes = await asyncio.gather(
+            *(account.get_home(home_id) for home_id in user.homes)
+        )
+
+        for (home_id, home_info), home in zip(user.homes.items(), homes):
             print(f"  Home: {home_id}: {home_info.label}")
-            home = await account.get_home(home_id)
 
             for device_id, device in home.devices.items():
                 print(f"   Device: {device_id}: {device.label} ({device.device_type})")
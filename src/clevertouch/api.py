@@ -1,14 +1,19 @@
 """Interface to the cloud API."""
 from __future__ import annotations
 import logging
+from functools import lru_cache
 from typing import Optional, NamedTuple, Any
 from hashlib import md5
-from aiohttp import ClientSession, ClientConnectionError, ClientError
+from aiohttp import ClientSession, ClientConnectionError, ClientError, TCPConnector
 
 from .util import ApiError
 
 _LOGGER = logging.getLogger(__name__)
 
+# Status codes returned by successful reads and writes
+_READ_OK_CODE = 1
+_WRITE_OK_CODE = 8
+
 
 class ApiStatus(NamedTuple):
     """Status of an API call."""
@@ -24,6 +29,12 @@ class ApiStatus(NamedTuple):
         return f"code={self.code}, key={self.key}, value={self.value}"
 
 
+@lru_cache(maxsize=64)
+def _intern_status(code: int, key: str, value: str) -> ApiStatus:
+    # Responses only use a handful of distinct statuses, share one object each
+    return ApiStatus(code, key, value)
+
+
 class ApiResult(NamedTuple):
     """Result of an API call."""
 
@@ -49,23 +60,51 @@ class ApiConnectError(ApiError):
 
 
 class ApiSession:
-    """Interface to the cloud API."""
+    """Interface to the cloud API.
+
+    An externally owned `ClientSession` may be provided via `session`, which
+    lets several API sessions share one connection pool. This is recommended
+    for long-running applications, e.g. Home Assistant. A provided session is
+    never closed by `close()`. Without it, a session is created on first use,
+    allowing at most `limit_per_host` concurrent connections, and closed by
+    `close()`.
+    """
+
+    __slots__ = (
+        "_api_url",
+        "_http_session",
+        "is_remote_session",
+        "_limit_per_host",
+        "email",
+        "token",
+        "_password_hash",
+        "_password_email",
+    )
 
     API_LANG = "en_GB"
     _LVI_API_BASE = "https://e3.lvi.eu"
     API_PATH = "/api/v0.1/"
+    _KEEPALIVE_TIMEOUT = 75
+    _DNS_CACHE_TTL = 300
 
     def __init__(
         self,
         email: Optional[str] = None,
         token: Optional[str] = None,
         *,
-        host: Optional[str] = None
+        host: Optional[str] = None,
+        session: Optional[ClientSession] = None,
+        limit_per_host: int = 32,
     ) -> None:
-        api_base = host or self._LVI_API_BASE
-        self._http_session: ClientSession = ClientSession(api_base)
+        self._api_url: str = (host or self._LVI_API_BASE) + self.API_PATH
+        self._http_session: Optional[ClientSession] = session
+        self.is_remote_session: bool = session is not None
+        self._limit_per_host: int = limit_per_host
         self.email: Optional[str] = email
         self.token: Optional[str] = token
+        # Hash of the last successful authentication, and the email it was for
+        self._password_hash: Optional[str] = None
+        self._password_email: Optional[str] = None
 
     async def __aenter__(self):
         return self
@@ -75,7 +114,21 @@ class ApiSession:
 
     async def close(self):
         """Close the connection to the cloud API."""
-        await self._http_session.close()
+        if self._http_session is not None and not self.is_remote_session:
+            await self._http_session.close()
+            self._http_session = None
+
+    def _get_http_session(self) -> ClientSession:
+        if self._http_session is None:
+            # All requests go to a single host, so size the pool for that host
+            # and keep connections and DNS lookups alive between refreshes
+            connector = TCPConnector(
+                limit_per_host=self._limit_per_host,
+                keepalive_timeout=self._KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=self._DNS_CACHE_TTL,
+            )
+            self._http_session = ClientSession(connector=connector)
+        return self._http_session
 
     async def authenticate(
         self,
@@ -83,12 +136,19 @@ class ApiSession:
         password: Optional[str] = None,
         password_hash: Optional[str] = None,
     ):
-        """Authenticate with the cloud API."""
+        """Authenticate with the cloud API.
+
+        Without a password or password hash, the hash from the previous
+        successful authentication of the same email is reused.
+        """
         self.email = email
         if password_hash is None or password_hash == "":
-            if password is None:
+            if password is not None:
+                password_hash = md5(password.encode()).hexdigest()
+            elif self._password_hash is not None and email == self._password_email:
+                password_hash = self._password_hash
+            else:
                 raise ApiError("No password provided")
-            password_hash = md5(password.encode()).hexdigest()
 
         endpoint = "human/user/auth/"
         payload = {
@@ -110,6 +170,8 @@ class ApiSession:
 
         self.email = result.data["user_infos"]["email"]
         self.token = result.data["token"]
+        self._password_hash = password_hash
+        self._password_email = email
 
     async def _read(
         self,
@@ -121,7 +183,7 @@ class ApiSession:
     ) -> ApiResult:
         result = await self._post(endpoint, payload, authenticate=authenticate)
         if throw_on_error:
-            if result.status.code != 1:
+            if result.status.code != _READ_OK_CODE:
                 raise ApiCallError(result.status, f"Read failed with {result.status}")
         return result
 
@@ -135,7 +197,7 @@ class ApiSession:
     ) -> ApiResult:
         result = await self._post(endpoint, payload, authenticate=authenticate)
         if throw_on_error:
-            if result.status.code != 8:
+            if result.status.code != _WRITE_OK_CODE:
                 raise ApiCallError(result.status, f"Write failed with {result.status}")
         return result
 
@@ -164,9 +226,8 @@ class ApiSession:
             "smarthome_id": home_id,
             "context": 1,
             "peremption": 15000,
+            **{f"query[{key}]": value for key, value in query_params.items()},
         }
-        for key, value in query_params.items():
-            payload[f"query[{key}]"] = value
 
         return await self._write(endpoint, payload)
 
@@ -182,7 +243,7 @@ class ApiSession:
             code_num = int(code["code"])
             code_key = code["key"]
             code_value = code["value"]
-            status = ApiStatus(code_num, code_key, code_value)
+            status = _intern_status(code_num, code_key, code_value)
         except Exception as ex:
             raise ApiError("API status is malformed") from ex
 
@@ -200,8 +261,8 @@ class ApiSession:
             )
 
         try:
-            async with self._http_session.post(
-                self.API_PATH + endpoint, data=payload
+            async with self._get_http_session().post(
+                self._api_url + endpoint, data=payload
             ) as response:
                 response.raise_for_status()
                 json_data = await response.json()
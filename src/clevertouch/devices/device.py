@@ -1,14 +1,60 @@
 """Models a device."""
 from __future__ import annotations
-from typing import Any
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Callable, Mapping, Optional
 
-from ..api import ApiSession
+from ..api import ApiSession, ApiConnectError
+from ..util import ApiError
 from ..info import HomeInfo, ZoneInfo
+from .const import DeviceTypeId
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _Batch:
+    """Changes collected by an open batch of a device"""
+
+    __slots__ = ("query_params", "updates", "is_open")
+
+    def __init__(self) -> None:
+        self.query_params: dict[str, Any] = {}
+        self.updates: list[Callable[[], None]] = []
+        self.is_open: bool = True
+
+
+# Batches opened by the current task, by device. Tasks started within a
+# batch inherit it while it is open, other tasks never see it.
+_BATCHES: ContextVar[Mapping[Device, _Batch]] = ContextVar(
+    "clevertouch_batches", default=MappingProxyType({})
+)
 
 
 class Device:
     """Models a generic device."""
 
+    __slots__ = (
+        "device_type",
+        "_session",
+        "home",
+        "device_id",
+        "device_type_id",
+        "id_local",
+        "label",
+        "zone",
+        "_data",
+        "_write_tasks",
+    )
+
+    # Attributes holding state that is changed locally by writes
+    _STATE_ATTRS: tuple[str, ...] = ()
+
+    _WRITE_ATTEMPTS = 3
+    _WRITE_RETRY_DELAY = 1.0
+
     def __init__(
         self,
         session: ApiSession,
@@ -24,18 +70,143 @@ class Device:
         self.home: HomeInfo = home
         self.device_id: str = Device.get_id(data)
         self.device_type_id: int = device_type_id
+        self._data: Optional[dict[str, Any]] = None
+        self._write_tasks: set[asyncio.Future[None]] = set()
         if do_update:
             self.update(data)
 
     def update(self, data: dict[str, Any]):
-        """Update the device information from cloud API data"""
+        """Update the device information from cloud API data
+
+        Data identical to the data of the previous update is skipped.
+        """
+        if data == self._data:
+            return
+        self._update(data)
+        self._data = data
+
+    def _update(self, data: dict[str, Any]):
         assert self.device_id == Device.get_id(data)
 
         self.id_local: str = data["id_device"]
         self.label: str = data["label_interface"]
         self.zone: ZoneInfo = self.home.zones[data["num_zone"]]
 
+    @asynccontextmanager
+    async def batch(self) -> AsyncIterator[Device]:
+        """Collect all changes made within the context into a single query.
+
+        The query is sent when the context exits without an exception, after
+        which the local state of the device is updated. Only changes made by
+        the task opening the batch are collected.
+        """
+        batches = _BATCHES.get()
+        active = batches.get(self)
+        if active is not None and active.is_open:
+            raise ApiError("A batch is already active for the device.")
+        batch = _Batch()
+        token = _BATCHES.set(MappingProxyType({**batches, self: batch}))
+        try:
+            yield self
+        finally:
+            batch.is_open = False
+            _BATCHES.reset(token)
+
+        if batch.query_params:
+            await self._send_query(batch.query_params, batch.updates)
+
+    async def _write_query(
+        self,
+        query_params: dict[str, Any],
+        update: Callable[[], None],
+        *,
+        eager_local: bool = False,
+    ) -> Optional[asyncio.Future[None]]:
+        # Write the query, or add it to the active batch, and update the
+        # local state once the query has been sent. With eager_local, the
+        # local state is updated first and the query is sent in the background.
+        batch = _BATCHES.get().get(self)
+        if batch is not None and batch.is_open:
+            if eager_local:
+                raise ApiError("Eager writes can not be used in a batch.")
+            batch.query_params.update(query_params)
+            batch.updates.append(update)
+            return None
+        if not eager_local:
+            await self._send_query(query_params, [update])
+            return None
+
+        before = self._get_state()
+        update()
+        # Only the values changed by this update are reverted on failure,
+        # as (previous value, assumed value)
+        changes = {
+            key: (before.get(key), value)
+            for key, value in self._get_state().items()
+            if value is not before.get(key)
+        }
+        task = asyncio.ensure_future(self._send_query_eagerly(query_params, changes))
+        # Keep a reference until done, the caller may not keep the task
+        self._write_tasks.add(task)
+        task.add_done_callback(self._write_tasks.discard)
+        task.add_done_callback(self._log_write_error)
+        return task
+
+    def _log_write_error(self, task: asyncio.Future[None]) -> None:
+        # Retrieving the exception keeps asyncio from reporting it as never
+        # retrieved when the caller does not await the task
+        if not task.cancelled() and task.exception() is not None:
+            _LOGGER.warning(
+                "Write to device %s failed: %s", self.device_id, task.exception()
+            )
+
+    async def _send_query_eagerly(
+        self, query_params: dict[str, Any], changes: dict[Any, tuple[Any, Any]]
+    ) -> None:
+        try:
+            for attempt in range(self._WRITE_ATTEMPTS):
+                try:
+                    await self._session.write_query(self.home.home_id, query_params)
+                    break
+                except ApiConnectError:
+                    if attempt == self._WRITE_ATTEMPTS - 1:
+                        raise
+                    await asyncio.sleep(self._WRITE_RETRY_DELAY * 2**attempt)
+        except ApiError:
+            # Revert the local changes made before the query was sent, unless
+            # they have since been replaced by a refresh or another write
+            state = self._get_state()
+            for key, (previous, assumed) in changes.items():
+                if state.get(key) is assumed:
+                    self._set_state(key, previous)
+            raise
+        finally:
+            self._data = None
+
+    def _get_state(self) -> dict[Any, Any]:
+        # The state changed locally by writes, as values that can be
+        # restored one by one with _set_state
+        return {name: getattr(self, name) for name in self._STATE_ATTRS}
+
+    def _set_state(self, key: Any, value: Any) -> None:
+        setattr(self, key, value)
+
+    async def _send_query(
+        self, query_params: dict[str, Any], updates: list[Callable[[], None]]
+    ) -> None:
+        await self._session.write_query(self.home.home_id, query_params)
+        # The local state will assume the change, so the next refresh
+        # must be applied even if the cloud data has not changed
+        self._data = None
+        for update in updates:
+            update()
+
     @classmethod
     def get_id(cls, data: dict[str, Any]) -> str:
         """Utility function to get the device id from cloud API data"""
         return data["id"]
+
+    @classmethod
+    def get_type_id(cls, data: dict[str, Any]) -> int:
+        """Utility function to get the device type id from cloud API data"""
+        return int(data["nv_mode"] or DeviceTypeId.UNDEFINED)
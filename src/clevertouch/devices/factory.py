@@ -10,14 +10,17 @@ from .onoff import Light, Outlet
 from .radiator import Radiator
 
 
+_DEVICE_CLASSES: dict[int, type[Device]] = {
+    DeviceTypeId.RADIATOR: Radiator,
+    DeviceTypeId.LIGHT: Light,
+    DeviceTypeId.OUTLET: Outlet,
+}
+
+
 def create_device(session: ApiSession, home: HomeInfo, data: dict[str, Any]) -> Device:
     """Create a device of of specific types based on the provided data."""
-    device_type_id = int(data["nv_mode"] or DeviceTypeId.UNDEFINED)
-    if device_type_id == DeviceTypeId.RADIATOR:
-        return Radiator(session, home, data)
-    elif device_type_id == DeviceTypeId.LIGHT:
-        return Light(session, home, data)
-    elif device_type_id == DeviceTypeId.OUTLET:
-        return Outlet(session, home, data)
-    else:
+    device_type_id = Device.get_type_id(data)
+    device_class = _DEVICE_CLASSES.get(device_type_id)
+    if device_class is None:
         return Device(session, home, data, DeviceType.UNKNOWN, device_type_id)
+    return device_class(session, home, data)
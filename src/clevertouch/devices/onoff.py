@@ -12,6 +12,8 @@ from .const import DeviceType, DeviceTypeId
 class OnOffDevice(Device):
     """Models an on/off device with a single on/off state and command."""
 
+    __slots__ = ("is_on",)
+
     def __init__(
         self,
         session: ApiSession,
@@ -24,9 +26,8 @@ class OnOffDevice(Device):
         self.is_on: bool = False
         self.update(data)
 
-    def update(self, data: dict[str, Any]):
-        """Update the radiator from cloud API data."""
-        super().update(data)
+    def _update(self, data: dict[str, Any]):
+        super()._update(data)
         self.is_on = data["on_off"] == "1"
 
     async def set_onoff_state(self, turn_on: bool):
@@ -40,16 +41,19 @@ class OnOffDevice(Device):
         query_params["nv_mode"] = self.device_type_id
         query_params["gv_mode"] = self.device_type_id
 
-        await self._session.write_query(self.home.home_id, query_params)
+        def update_state():
+            # This is debatable - for some scenarios it is reasonable to
+            # update the value in the current object with the assumed
+            # change, for others not
+            self.is_on = turn_on
 
-        # This is debatable - for some scenarios it is reasonable to
-        # update the value in the current object with the assumed
-        # change, for others not
-        self.is_on = turn_on
+        await self._write_query(query_params, update_state)
 
 class Light(OnOffDevice):
     """Models a light."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         session: ApiSession,
@@ -61,6 +65,8 @@ class Light(OnOffDevice):
 class Outlet(OnOffDevice):
     """Models an outlet."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         session: ApiSession,
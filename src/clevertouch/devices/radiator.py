@@ -1,6 +1,10 @@
 """Models a radiator."""
 from __future__ import annotations
-from typing import Optional, Any, NamedTuple
+import asyncio
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from types import MappingProxyType
+from typing import Optional, Any, Callable, Final, Mapping, NamedTuple
 
 from .. import ApiSession, ApiError
 from ..info import HomeInfo
@@ -39,10 +43,9 @@ class TempType(StrEnum):
     MANUAL = "manual"
 
 
-class Radiator(Device):
-    """Models a radiator."""
-
-    _DEVICE_TO_MODE_TYPE: dict[str, _ModeInfo] = {
+# Lookup tables are read-only, and shared with the class attributes of Radiator
+_DEVICE_TO_MODE_TYPE: Final[Mapping[str, _ModeInfo]] = MappingProxyType(
+    {
         "0": _ModeInfo(HeatMode.COMFORT, TempType.COMFORT),
         "1": _ModeInfo(HeatMode.OFF, TempType.NONE),
         "2": _ModeInfo(HeatMode.COMFORT, TempType.COMFORT),
@@ -56,8 +59,10 @@ class Radiator(Device):
         # "15": ModeInfo("manual", "manual"),
         # "16": ModeInfo("program", "boost"),
     }
+)
 
-    _HEAT_MODE_TO_DEVICE: dict[str, str] = {
+_HEAT_MODE_TO_DEVICE: Final[Mapping[str, str]] = MappingProxyType(
+    {
         HeatMode.ECO: "3",
         HeatMode.FROST: "2",
         HeatMode.COMFORT: "0",
@@ -65,15 +70,19 @@ class Radiator(Device):
         HeatMode.BOOST: "4",
         HeatMode.OFF: "1",
     }
+)
 
-    _HEAT_MODE_TO_WRITABLE_TEMP_TYPE: dict[str, str] = {
+_HEAT_MODE_TO_WRITABLE_TEMP_TYPE: Final[Mapping[str, str]] = MappingProxyType(
+    {
         HeatMode.ECO: TempType.ECO,
         HeatMode.FROST: TempType.FROST,
         HeatMode.COMFORT: TempType.COMFORT,
         HeatMode.BOOST: TempType.BOOST,
     }
+)
 
-    _TEMP_TYPE_TO_DEVICE: dict[str, str] = {
+_TEMP_TYPE_TO_DEVICE: Final[Mapping[str, str]] = MappingProxyType(
+    {
         TempType.ECO: "consigne_eco",
         TempType.FROST: "consigne_hg",
         TempType.COMFORT: "consigne_confort",
@@ -81,19 +90,51 @@ class Radiator(Device):
         TempType.MANUAL: "consigne_manuel",
         TempType.BOOST: "consigne_boost",
     }
+)
+
+
+class Radiator(Device):
+    """Models a radiator."""
 
-    _AVAILABLE_TEMP_TYPES: list[str] = [
+    __slots__ = (
+        "modes",
+        "active",
+        "heat_mode",
+        "temp_type",
+        "boost_time",
+        "boost_remaining",
+        "temperatures",
+    )
+
+    # Temperatures are added to the state one by one, see _get_state
+    _STATE_ATTRS = ("heat_mode", "boost_time", "boost_remaining")
+
+    _DEVICE_TO_MODE_TYPE: Final[Mapping[str, _ModeInfo]] = _DEVICE_TO_MODE_TYPE
+    _HEAT_MODE_TO_DEVICE: Final[Mapping[str, str]] = _HEAT_MODE_TO_DEVICE
+    _HEAT_MODE_TO_WRITABLE_TEMP_TYPE: Final[
+        Mapping[str, str]
+    ] = _HEAT_MODE_TO_WRITABLE_TEMP_TYPE
+    _TEMP_TYPE_TO_DEVICE: Final[Mapping[str, str]] = _TEMP_TYPE_TO_DEVICE
+
+    _AVAILABLE_TEMP_TYPES: Final[tuple[str, ...]] = (
         TempType.ECO,
         TempType.FROST,
         TempType.COMFORT,
         TempType.CURRENT,
         TempType.BOOST,
-    ]
+    )
 
-    _READONLY_TEMP_TYPES: list[str] = [
-        TempType.CURRENT,
-        TempType.TARGET,
-    ]
+    # Gets the cloud API values of _AVAILABLE_TEMP_TYPES, in the same order
+    _GET_TEMP_VALUES: Final[
+        Callable[[dict[str, Any]], tuple[str, ...]]
+    ] = itemgetter(*map(_TEMP_TYPE_TO_DEVICE.__getitem__, _AVAILABLE_TEMP_TYPES))
+
+    _READONLY_TEMP_TYPES: Final[frozenset[str]] = frozenset(
+        {
+            TempType.CURRENT,
+            TempType.TARGET,
+        }
+    )
 
     _AVAILABLE_HEAT_MODES: list[str] = [
         HeatMode.COMFORT,
@@ -122,29 +163,40 @@ class Radiator(Device):
         self.temperatures: dict[str, Temperature] = {}
         self.update(data)
 
-    def update(self, data: dict[str, Any]):
-        """Update the radiator from cloud API data."""
-        super().update(data)
-        mode_num = data["gv_mode"]
-        program_type = self._DEVICE_TO_MODE_TYPE[mode_num]
+    def _update(self, data: dict[str, Any]):
+        super()._update(data)
+        # Bind class level tables once, they are used for every temperature
+        readonly_temp_types = self._READONLY_TEMP_TYPES
+        program_type = self._DEVICE_TO_MODE_TYPE[data["gv_mode"]]
         self.active = data["heating_up"] == "1"
         self.heat_mode = program_type.heat_mode
         self.temp_type = program_type.temp_type
-        self.temperatures = {
-            temp: Temperature(
-                int(data[self._TEMP_TYPE_TO_DEVICE[temp]]),
-                is_writable=temp not in self._READONLY_TEMP_TYPES,
-                name=temp,
-            )
-            for temp in self._AVAILABLE_TEMP_TYPES
-        }
-        self.temperatures[TempType.TARGET] = Temperature(
+        # Only replace temperatures that have changed, keeping the
+        # existing objects for unchanged values
+        temperatures = self.temperatures
+        for temp, value in zip(
+            self._AVAILABLE_TEMP_TYPES, self._GET_TEMP_VALUES(data)
+        ):
+            device_temp = int(value)
+            current = temperatures.get(temp)
+            if current is None or current.device != device_temp:
+                temperatures[temp] = Temperature(
+                    device_temp,
+                    is_writable=temp not in readonly_temp_types,
+                    name=temp,
+                )
+        target_device = (
             None
             if self.temp_type == TempType.NONE
-            else self.temperatures[self.temp_type].device,
-            is_writable=False,
-            name=TempType.TARGET,
+            else temperatures[self.temp_type].device
         )
+        target = temperatures.get(TempType.TARGET)
+        if target is None or target.device != target_device:
+            temperatures[TempType.TARGET] = Temperature(
+                target_device,
+                is_writable=False,
+                name=TempType.TARGET,
+            )
         # Read boost settings
         # 'boost_time' is the user writable boost time
         self.boost_time = int(data.get("time_boost") or 0)
@@ -152,16 +204,43 @@ class Radiator(Device):
         node = data.get("time_boost_format_chrono")
         if node:
             self.boost_remaining = (
-                int(node.get("d") or 0) * 24 * 60 * 60
-                + int(node.get("h") or 0) * 60 * 60
+                int(node.get("d") or 0) * 86400
+                + int(node.get("h") or 0) * 3600
                 + int(node.get("m") or 0) * 60
                 + int(node.get("s") or 0)
             )
         else:
             self.boost_remaining = None
 
-    async def set_temperature(self, temp_type: str, temp_value: float, unit: str):
-        """Set a specific temperature for a radiator"""
+    def _get_state(self) -> dict[Any, Any]:
+        state = super()._get_state()
+        for temp_type, temperature in self.temperatures.items():
+            state[("temperatures", temp_type)] = temperature
+        return state
+
+    def _set_state(self, key: Any, value: Any) -> None:
+        if isinstance(key, tuple):
+            self.temperatures[key[1]] = value
+        else:
+            super()._set_state(key, value)
+
+    async def set_temperature(
+        self,
+        temp_type: str,
+        temp_value: float,
+        unit: str,
+        *,
+        eager_local: bool = False,
+    ) -> Optional[asyncio.Future[None]]:
+        """Set a specific temperature for a radiator
+
+        With `eager_local`, the radiator is updated before the request is
+        sent in the background. The background task is returned and the
+        update is reverted if the request fails, unless the updated values
+        have changed since. The error of a failed request is logged, and
+        raised by the task if awaited. `eager_local` can not be used in a
+        `batch`.
+        """
         if temp_type not in self._TEMP_TYPE_TO_DEVICE:
             raise ApiError(f"Temperature {temp_type} not available.")
         elif temp_type in self._READONLY_TEMP_TYPES:
@@ -173,24 +252,32 @@ class Radiator(Device):
         query_params["id_device"] = self.id_local
         query_params[Radiator._TEMP_TYPE_TO_DEVICE[temp_type]] = new_temp.device
 
-        await self._session.write_query(self.home.home_id, query_params)
+        def update_state():
+            # This is debatable - for some scenarios it is reasonable to
+            # update the value in the current object with the assumed
+            # change, for others not
+            self.temperatures[temp_type] = new_temp
 
-        # This is debatable - for some scenarios it is reasonable to
-        # update the value in the current object with the assumed
-        # change, for others not
-        self.temperatures[temp_type] = new_temp
+            # To further complicate. If the temp_type set is the same type
+            # that the object currently targets, that value should be updated as well
+            if temp_type == self.temp_type:
+                self.temperatures[TempType.TARGET] = Temperature(
+                    new_temp.device,
+                    is_writable=False,
+                    name=TempType.TARGET,
+                )
+
+        return await self._write_query(
+            query_params, update_state, eager_local=eager_local
+        )
 
-        # To further complicate. If the temp_type set is the same type
-        # that the object currently targets, that value should be updated as well
-        if temp_type == self.temp_type:
-            self.temperatures[TempType.TARGET] = Temperature(
-                new_temp.device,
-                is_writable=False,
-                name=TempType.TARGET,
-            )
+    async def set_heat_mode(
+        self, heat_mode: str, *, eager_local: bool = False
+    ) -> Optional[asyncio.Future[None]]:
+        """Set a the heating mode for a radiator
 
-    async def set_heat_mode(self, heat_mode: str):
-        """Set a the heating mode for a radiator"""
+        See `set_temperature` for `eager_local`.
+        """
         if heat_mode not in self._HEAT_MODE_TO_DEVICE:
             raise ApiError(f"Heating mode {heat_mode} not available.")
 
@@ -199,22 +286,33 @@ class Radiator(Device):
         query_params["gv_mode"] = self._HEAT_MODE_TO_DEVICE[heat_mode]
         query_params["nv_mode"] = self._HEAT_MODE_TO_DEVICE[heat_mode]
 
-        await self._session.write_query(self.home.home_id, query_params)
+        def update_state():
+            # Debatable - see set_temperature
+            self.heat_mode = heat_mode
 
-        # Debatable - see set_temperature
-        self.heat_mode = heat_mode
+        return await self._write_query(
+            query_params, update_state, eager_local=eager_local
+        )
 
-    async def set_boost_time(self, boost_time: int) -> None:
-        """Set default boost time for subsequent activations of boost mode"""
+    async def set_boost_time(
+        self, boost_time: int, *, eager_local: bool = False
+    ) -> Optional[asyncio.Future[None]]:
+        """Set default boost time for subsequent activations of boost mode
+
+        See `set_temperature` for `eager_local`.
+        """
 
         query_params = {}
         query_params["id_device"] = self.id_local
         query_params["time_boost"] = boost_time
 
-        await self._session.write_query(self.home.home_id, query_params)
+        def update_state():
+            # Debatable - see set_temperature
+            self.boost_time = boost_time
 
-        # Debatable - see set_temperature
-        self.boost_time = boost_time
+        return await self._write_query(
+            query_params, update_state, eager_local=eager_local
+        )
 
     async def activate_mode(
         self,
@@ -257,23 +355,31 @@ class Radiator(Device):
         query_params["gv_mode"] = self._HEAT_MODE_TO_DEVICE[heat_mode]
         query_params["nv_mode"] = self._HEAT_MODE_TO_DEVICE[heat_mode]
 
+        new_temp: Optional[Temperature] = None
         if temp_value and temp_unit:
             temp_type = self._HEAT_MODE_TO_WRITABLE_TEMP_TYPE[heat_mode]
             new_temp = Temperature(
                 temp_value, temp_unit, is_writable=True, name=temp_type
             )
             query_params[self._TEMP_TYPE_TO_DEVICE[temp_type]] = new_temp.device
-            # Debatable - see set_temperature
-            self.temperatures[temp_type] = new_temp
-            self.temperatures[TempType.TARGET] = new_temp
 
         if boost_time:
             query_params["time_boost"] = boost_time
+
+        def update_state():
             # Debatable - see set_temperature
-            self.boost_time = boost_time
-            self.boost_remaining = boost_time
+            if new_temp is not None:
+                self.temperatures[temp_type] = new_temp
+                self.temperatures[TempType.TARGET] = Temperature(
+                    new_temp.device,
+                    is_writable=False,
+                    name=TempType.TARGET,
+                )
+            if boost_time:
+                self.boost_time = boost_time
+                self.boost_remaining = boost_time
 
-        await self._session.write_query(self.home.home_id, query_params)
+        await self._write_query(query_params, update_state)
 
 
 class TempUnit(StrEnum):
@@ -284,9 +390,44 @@ class TempUnit(StrEnum):
     FARENHEIT = "farenheit"
 
 
+# Unit dispatch tables, keyed by the plain string values of the units
+_UNIT_TO_DEVICE: Final[dict[str, Callable[[float], int]]] = {
+    TempUnit.CELSIUS.value: lambda temperature: round(18 * temperature + 320),
+    TempUnit.FARENHEIT.value: lambda temperature: round(10 * temperature),
+    TempUnit.DEVICE.value: round,
+}
+
+_UNIT_FROM_TEMPERATURE: Final[
+    dict[str, Callable[[Temperature], Optional[float]]]
+] = {
+    TempUnit.CELSIUS.value: attrgetter("celsius"),
+    TempUnit.FARENHEIT.value: attrgetter("farenheit"),
+    TempUnit.DEVICE.value: attrgetter("device"),
+}
+
+
+class _TemperatureValues(NamedTuple):
+    device: int
+    celsius: float
+    farenheit: float
+
+
+@lru_cache(maxsize=1024)
+def _temperature_values(device_temperature: int) -> _TemperatureValues:
+    # Device temperatures are small integers, so conversions are
+    # computed once per value and shared between temperatures
+    return _TemperatureValues(
+        device_temperature,
+        (device_temperature - 320) / 18,
+        device_temperature / 10,
+    )
+
+
 class Temperature:
     """Models a temperature with device specific unit conversions."""
 
+    __slots__ = ("name", "is_writable", "device", "celsius", "farenheit")
+
     def __init__(
         self,
         temperature: Optional[float],
@@ -304,28 +445,23 @@ class Temperature:
             self.farenheit: Optional[float] = None
             return None
 
-        if unit == TempUnit.CELSIUS:
-            device_temperature = round(18 * temperature + 320)
-        elif unit == TempUnit.FARENHEIT:
-            device_temperature = round(10 * temperature)
-        elif unit == TempUnit.DEVICE:
-            device_temperature = round(temperature)
-        else:
-            raise KeyError(f"Unknown unit: {unit}")
+        try:
+            to_device = _UNIT_TO_DEVICE[unit]
+        except KeyError:
+            raise KeyError(f"Unknown unit: {unit}") from None
+        device_temperature = to_device(temperature)
 
-        self.device = device_temperature
-        self.celsius = (device_temperature - 320) / 18
-        self.farenheit = device_temperature / 10
+        self.device, self.celsius, self.farenheit = _temperature_values(
+            device_temperature
+        )
 
     def as_unit(self, unit: str) -> Optional[float]:
         """Return the temperature expressed as the specified unit."""
-        if unit == TempUnit.CELSIUS:
-            return self.celsius
-        if unit == TempUnit.FARENHEIT:
-            return self.farenheit
-        if unit == TempUnit.DEVICE:
-            return self.device
-        raise ApiError(f"Unknown temperature unit '{unit}'")
+        try:
+            from_temperature = _UNIT_FROM_TEMPERATURE[unit]
+        except KeyError:
+            raise ApiError(f"Unknown temperature unit '{unit}'") from None
+        return from_temperature(self)
 
     @classmethod
     def convert(
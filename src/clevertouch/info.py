@@ -6,9 +6,12 @@ from typing import Any, Optional
 class HomeInfo:
     """Provides information about a home."""
 
+    __slots__ = ("home_id", "label", "zones")
+
     def __init__(
         self, *, home_id: Optional[str] = None, data: Optional[dict[str, Any]] = None
     ) -> None:
+        self.zones: dict[str, ZoneInfo] = {}
         if home_id is not None:
             assert data is None
             self.home_id = home_id
@@ -22,15 +25,16 @@ class HomeInfo:
         """Update home info from API data."""
         assert self.get_id(data) == self.home_id
         self.label = data["label"]
-        if "zones" in data:
-            self.zones = {
-                zone.id_local: zone
-                for zone in [
-                    ZoneInfo(zone_data) for zone_data in data["zones"].values()
-                ]
-            }
-        else:
-            self.zones = {}
+        # Keep existing zone objects, since devices refer to them
+        zones: dict[str, ZoneInfo] = {}
+        for zone_data in data.get("zones", {}).values():
+            zone = self.zones.get(ZoneInfo.get_id(zone_data))
+            if zone is None:
+                zone = ZoneInfo(zone_data)
+            else:
+                zone.update(zone_data)
+            zones[zone.id_local] = zone
+        self.zones = zones
 
     @classmethod
     def get_id(cls, data: dict[str, Any]):
@@ -41,8 +45,15 @@ class HomeInfo:
 class ZoneInfo:
     """Contains information about a zone in a home"""
 
+    __slots__ = ("id_local", "label")
+
     def __init__(self, data: dict[str, Any]) -> None:
         self.id_local: str = data["num_zone"]
+        self.update(data)
+
+    def update(self, data: dict[str, Any]):
+        """Update zone info from API data."""
+        assert self.get_id(data) == self.id_local
         self.label: str = data["zone_label"]
 
     @classmethod
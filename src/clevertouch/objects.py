@@ -1,6 +1,8 @@
 """Provides an object-based abstraction for communicating with the cloud API."""
 from __future__ import annotations
+import asyncio
 from typing import Optional, Any
+from aiohttp import ClientSession
 
 from .util import ApiError
 from .api import ApiSession
@@ -10,19 +12,35 @@ from .info import HomeInfo
 
 
 class Account:
-    """A represention of an account connected to the cloud API."""
+    """A represention of an account connected to the cloud API.
+
+    See `ApiSession` for how an externally owned `session` is handled.
+    """
+
+    _MAX_CONCURRENT_REQUESTS = 10
 
     def __init__(
         self,
         email: Optional[str] = None,
         token: Optional[str] = None,
         *,
-        host: Optional[str] = None
+        host: Optional[str] = None,
+        session: Optional[ClientSession] = None,
     ) -> None:
-        self._api_session: ApiSession = ApiSession(email, token, host=host)
+        self._api_session: ApiSession = ApiSession(
+            email, token, host=host, session=session
+        )
         self.email: Optional[str] = email
         self.user: Optional[User] = None
         self.homes: dict[str, Home] = {}
+        # Requests in progress, shared by concurrent callers
+        self._user_tasks: dict[str, asyncio.Future[User]] = {}
+        self._home_tasks: dict[str, asyncio.Future[Home]] = {}
+
+    @property
+    def token(self) -> Optional[str]:
+        """The token used for authenticating calls to the cloud API."""
+        return self._api_session.token
 
     async def __aenter__(self):
         return self
@@ -40,10 +58,24 @@ class Account:
         password: Optional[str] = None,
         password_hash: Optional[str] = None,
     ) -> None:
-        """Authenticate with the cloud API and store credentials."""
+        """Authenticate with the cloud API and store credentials.
+
+        Data read for a previous email is dropped, and reads of it still in
+        progress are cancelled.
+        """
         await self._api_session.authenticate(email, password, password_hash)
+        if self._api_session.email != self.email:
+            self._clear()
         self.email = self._api_session.email
 
+    def _clear(self) -> None:
+        for task in (*self._user_tasks.values(), *self._home_tasks.values()):
+            task.cancel()
+        self.user = None
+        self.homes = {}
+        self._user_tasks = {}
+        self._home_tasks = {}
+
     async def get_user(self) -> User:
         """Get user information from the account.
 
@@ -51,19 +83,45 @@ class Account:
         Does not refresh automatically from the cloud API after first access.
         """
         user = self.user
-        if user is None:
-            if self.email is None:
-                raise ApiError("no email specified")
-            user = User(self._api_session, self.email)
-            await user.refresh()
+        if user is not None:
+            return user
+        email = self.email
+        if email is None:
+            raise ApiError("no email specified")
+        tasks = self._user_tasks
+        task = tasks.get(email)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_user(email))
+            tasks[email] = task
+            task.add_done_callback(lambda _: tasks.pop(email, None))
+        return await asyncio.shield(task)
+
+    async def _fetch_user(self, email: str) -> User:
+        user = User(self._api_session, email)
+        await user.refresh()
+        self.user = user
         return user
 
     async def get_home(self, home_id: str) -> Home:
-        """Get information for a specific home."""
+        """Get information for a specific home.
+
+        Does not refresh automatically from the cloud API after first access.
+        """
         home = self.homes.get(home_id)
-        if home is None:
-            home = Home(self._api_session, home_id)
-            await home.refresh()
+        if home is not None:
+            return home
+        tasks = self._home_tasks
+        task = tasks.get(home_id)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_home(home_id))
+            tasks[home_id] = task
+            task.add_done_callback(lambda _: tasks.pop(home_id, None))
+        return await asyncio.shield(task)
+
+    async def _fetch_home(self, home_id: str) -> Home:
+        home = Home(self._api_session, home_id)
+        await home.refresh()
+        self.homes[home_id] = home
         return home
 
     async def get_homes(self) -> list[Home]:
@@ -72,11 +130,15 @@ class Account:
         Does not refresh automatically from the cloud API after first access.
         """
         user = await self.get_user()
-        homes: list[Home] = []
-        for home_id in user.homes:
-            home = await self.get_home(home_id)
-            homes.append(home)
-        return homes
+        semaphore = asyncio.Semaphore(self._MAX_CONCURRENT_REQUESTS)
+
+        async def get_home(home_id: str) -> Home:
+            async with semaphore:
+                return await self.get_home(home_id)
+
+        return list(
+            await asyncio.gather(*(get_home(home_id) for home_id in user.homes))
+        )
 
 
 class Home:
@@ -91,11 +153,13 @@ class Home:
     def _update(self, data):
         self.info.update(data)
 
+        devices = self.devices
+        get_id = Device.get_id
         for device_data in data["devices"].values():
-            device_id = Device.get_id(device_data)
-            device = self.devices.get(device_id)
+            device_id = get_id(device_data)
+            device = devices.get(device_id)
             if device is None:
-                self.devices[device_id] = create_device(
+                devices[device_id] = create_device(
                     self._api_session, self.info, device_data
                 )
             else:
@@ -125,7 +189,7 @@ class User:
         self.user_id = data["user_id"]
         self.homes = {
             home.home_id: home
-            for home in [
+            for home in (
                 HomeInfo(data=home_data) for home_data in data["smarthomes"].values()
-            ]
+            )
         }
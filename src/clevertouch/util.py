@@ -1,5 +1,6 @@
 """Utility classes for the CleverTouch library"""
 from __future__ import annotations
+import sys
 from typing import Union, Any, Dict
 
 from enum import Enum, auto as enum_auto
@@ -10,19 +11,31 @@ class ApiError(Exception):
 
 ApiData = Dict[str, Any]
 
-class StrEnum(str, Enum):
-    """Support for StrEnum similar to built-in after version 3.9"""
+if sys.version_info >= (3, 11):
+    from enum import StrEnum as _StrEnum
 
-    def __new__(cls, value: Union[str, enum_auto], *args, **kwargs):
-        if not isinstance(value, (str, enum_auto)):
-            raise TypeError(
-                f"Values of StrEnums must be strings: {value!r} is a {type(value)}"
-            )
-        return super().__new__(cls, value, *args, **kwargs)
+    class StrEnum(_StrEnum):
+        """Built-in StrEnum, keeping member names as values for auto()"""
 
-    def __str__(self):
-        return str(self.value)
+        # pylint: disable=no-self-argument
+        def _generate_next_value_(name, *_):
+            return name
 
-    # pylint: disable=no-self-argument
-    def _generate_next_value_(name, *_):
-        return name
+else:
+
+    class StrEnum(str, Enum):
+        """Support for StrEnum similar to built-in after version 3.9"""
+
+        def __new__(cls, value: Union[str, enum_auto], *args, **kwargs):
+            if not isinstance(value, (str, enum_auto)):
+                raise TypeError(
+                    f"Values of StrEnums must be strings: {value!r} is a {type(value)}"
+                )
+            return super().__new__(cls, value, *args, **kwargs)
+
+        def __str__(self):
+            return str(self.value)
+
+        # pylint: disable=no-self-argument
+        def _generate_next_value_(name, *_):
+            return name
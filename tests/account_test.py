@@ -0,0 +1,93 @@
+import asyncio
+import pytest
+
+from clevertouch import Account, ApiError
+
+from conftest import FakeApiSession, HOME_ID, home_data
+
+
+@pytest.fixture
+def fake_account(api_session: FakeApiSession) -> Account:
+    """An account connected to the fake API session, with two homes"""
+    api_session.user_data["smarthomes"]["1"] = {"smarthome_id": "h2", "label": "Cabin"}
+    api_session.home_data["h2"] = dict(home_data(), smarthome_id="h2")
+    account = Account(api_session.email)
+    account._api_session = api_session
+    return account
+
+
+async def test_concurrent_reads(api_session: FakeApiSession, fake_account: Account):
+    """Test that concurrent calls read the user and each home once"""
+    homes, home, _ = await asyncio.gather(
+        fake_account.get_homes(),
+        fake_account.get_home(HOME_ID),
+        fake_account.get_homes(),
+    )
+    assert sorted(api_session.reads) == ["h1", "h2", "user"]
+    assert home is homes[0] is fake_account.homes[HOME_ID]
+
+    await fake_account.get_homes()
+    assert len(api_session.reads) == 3
+
+
+async def test_cancelled_caller(api_session: FakeApiSession, fake_account: Account):
+    """Test that cancelling one caller does not cancel the read of others"""
+    cancelled = asyncio.ensure_future(fake_account.get_home(HOME_ID))
+    waiting = asyncio.ensure_future(fake_account.get_home(HOME_ID))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    home = await waiting
+    assert home.home_id == HOME_ID
+    assert api_session.reads == [HOME_ID]
+
+
+async def test_failed_read_retried(api_session: FakeApiSession, fake_account: Account):
+    """Test that a failed read is retried by the next call"""
+    home = api_session.home_data.pop("h2")
+    results = await asyncio.gather(
+        fake_account.get_home("h2"),
+        fake_account.get_home("h2"),
+        return_exceptions=True,
+    )
+    assert all(isinstance(result, ApiError) for result in results)
+    assert api_session.reads == ["h2"]
+    assert "h2" not in fake_account.homes
+
+    api_session.home_data["h2"] = home
+    assert (await fake_account.get_home("h2")).home_id == "h2"
+    assert api_session.reads == ["h2", "h2"]
+
+
+async def test_authenticate_other_email(
+    api_session: FakeApiSession, fake_account: Account
+):
+    """Test that data of the previous account is dropped for another email"""
+    await fake_account.get_homes()
+    await fake_account.authenticate(api_session.email, "password")
+    await fake_account.get_homes()
+    assert len(api_session.reads) == 3
+
+    api_session.user_data = {
+        "user_id": "u2",
+        "smarthomes": {"0": {"smarthome_id": "h3", "label": "Flat"}},
+    }
+    api_session.home_data["h3"] = dict(home_data(), smarthome_id="h3")
+    await fake_account.authenticate("other@example.com", "password")
+
+    assert (await fake_account.get_user()).user_id == "u2"
+    assert [home.home_id for home in await fake_account.get_homes()] == ["h3"]
+    assert list(fake_account.homes) == ["h3"]
+
+
+async def test_authenticate_during_read(
+    api_session: FakeApiSession, fake_account: Account
+):
+    """Test that a read in progress for the previous account is not stored"""
+    reading = asyncio.ensure_future(fake_account.get_home(HOME_ID))
+    await asyncio.sleep(0)
+    await fake_account.authenticate("other@example.com", "password")
+
+    with pytest.raises(asyncio.CancelledError):
+        await reading
+    assert not fake_account.homes
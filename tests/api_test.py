@@ -0,0 +1,61 @@
+import pytest
+from aiohttp import ClientSession
+
+from clevertouch import ApiSession, ApiError
+from clevertouch.api import ApiResult, ApiStatus
+
+
+async def test_close_provided_session():
+    """Test that a provided session is kept open when the API session closes"""
+    async with ClientSession() as http_session:
+        async with ApiSession(session=http_session) as api_session:
+            assert api_session._get_http_session() is http_session
+        assert not http_session.closed
+
+
+async def test_close_created_session():
+    """Test that a session created on first use is closed and reset"""
+    api_session = ApiSession()
+    http_session = api_session._get_http_session()
+    assert api_session._get_http_session() is http_session
+
+    await api_session.close()
+    assert http_session.closed
+
+    new_session = api_session._get_http_session()
+    assert new_session is not http_session
+    await api_session.close()
+    assert new_session.closed
+
+
+class _StubApiSession(ApiSession):
+    """API session answering authentication requests without calling the cloud"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.passwords: list[str] = []
+
+    async def _post(self, endpoint, payload, *, authenticate):
+        self.passwords.append(payload["password"])
+        status = ApiStatus(1, "OK", "ok")
+        # The cloud API may return the email in a different case
+        data = {"user_infos": {"email": payload["email"].lower()}, "token": "t"}
+        return ApiResult(status, data, {})
+
+
+async def test_reauthenticate_same_email():
+    """Test that the password hash is reused for the same email"""
+    api_session = _StubApiSession()
+    await api_session.authenticate("User@example.com", "password")
+    await api_session.authenticate("User@example.com")
+    assert len(api_session.passwords) == 2
+    assert api_session.passwords[0] == api_session.passwords[1]
+
+
+async def test_reauthenticate_other_email():
+    """Test that the password hash is not reused for another email"""
+    api_session = _StubApiSession()
+    await api_session.authenticate("user@example.com", "password")
+    with pytest.raises(ApiError, match="No password provided"):
+        await api_session.authenticate("other@example.com")
+    assert len(api_session.passwords) == 1
@@ -0,0 +1,173 @@
+from __future__ import annotations
+import asyncio
+import copy
+import pytest
+import pytest_asyncio
+import os
+from types import SimpleNamespace
+from typing import Any, Optional
+from dotenv import load_dotenv
+
+from clevertouch import Account, User, ApiError
+from clevertouch.devices import Radiator
+from clevertouch.info import HomeInfo
+
+# Key of the token cached between test runs
+_TOKEN_CACHE_KEY = "clevertouch/token"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def credentials() -> SimpleNamespace:
+    """Credentials read once from the environment or .env"""
+    load_dotenv()
+    return SimpleNamespace(
+        email=os.getenv("CLEVERTOUCH_EMAIL", ""),
+        password=os.getenv("CLEVERTOUCH_PASSWORD", ""),
+    )
+
+
+@pytest.fixture(scope="session")
+def live_credentials(credentials: SimpleNamespace) -> SimpleNamespace:
+    """Credentials for calling the cloud API, skipping the test if missing"""
+    if not credentials.email or not credentials.password:
+        pytest.skip(
+            "Credentials missing, set CLEVERTOUCH_EMAIL and CLEVERTOUCH_PASSWORD "
+            "in the environment or .env"
+        )
+    return credentials
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def account(request: pytest.FixtureRequest, live_credentials: SimpleNamespace):
+    """An account authenticated once for the whole test session
+
+    The token is cached between test runs and only renewed when rejected.
+    """
+    credentials = live_credentials
+    cache = getattr(request.config, "cache", None)
+    cached = cache.get(_TOKEN_CACHE_KEY, None) if cache is not None else None
+    token = None
+    if cached is not None and cached.get("email") == credentials.email:
+        token = cached.get("token")
+
+    async with Account(credentials.email, token) as session:
+        if token is not None:
+            try:
+                await session.get_user()
+            except ApiError:
+                token = None
+        if token is None:
+            await session.authenticate(
+                credentials.email, password=credentials.password
+            )
+            if cache is not None:
+                cache.set(
+                    _TOKEN_CACHE_KEY,
+                    {"email": credentials.email, "token": session.token},
+                )
+        yield session
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def user(account: Account) -> User:
+    """The user of the shared account, read once for the whole test session"""
+    return await account.get_user()
+
+
+HOME_ID = "h1"
+
+
+def home_data(**radiator: Any) -> dict[str, Any]:
+    """Cloud API data of a home with a single radiator"""
+    return {
+        "smarthome_id": HOME_ID,
+        "label": "Home",
+        "zones": {"0": {"num_zone": "1", "zone_label": "Living room"}},
+        "devices": {"0": radiator_data(**radiator)},
+    }
+
+
+def radiator_data(**values: Any) -> dict[str, Any]:
+    """Cloud API data of a radiator in eco mode, with optional overrides"""
+    data = {
+        "id": "r1",
+        "id_device": "C1",
+        "label_interface": "Radiator",
+        "num_zone": "1",
+        "nv_mode": "0",
+        "gv_mode": "3",
+        "heating_up": "1",
+        "consigne_eco": "600",
+        "consigne_hg": "140",
+        "consigne_confort": "650",
+        "temperature_air": "650",
+        "consigne_boost": "700",
+        "consigne_manuel": "0",
+        "time_boost": "3600",
+        "time_boost_format_chrono": {"d": "0", "h": "1", "m": "0", "s": "0"},
+    }
+    data.update(values)
+    return data
+
+
+class FakeApiSession:
+    """Stands in for `ApiSession`, serving data and recording the calls
+
+    Writes wait for `write_gate` when set, and raise the exceptions queued
+    in `write_errors` in order.
+    """
+
+    def __init__(self) -> None:
+        self.email: Optional[str] = "user@example.com"
+        self.user_data: dict[str, Any] = {
+            "user_id": "u1",
+            "smarthomes": {"0": {"smarthome_id": HOME_ID, "label": "Home"}},
+        }
+        self.home_data: dict[str, dict[str, Any]] = {HOME_ID: home_data()}
+        self.reads: list[str] = []
+        self.writes: list[tuple[str, dict[str, Any]]] = []
+        self.write_errors: list[Exception] = []
+        self.write_gate: Optional[asyncio.Event] = None
+
+    async def authenticate(
+        self,
+        email: str,
+        password: Optional[str] = None,
+        password_hash: Optional[str] = None,
+    ) -> None:
+        self.email = email
+
+    async def read_user_data(self) -> dict[str, Any]:
+        self.reads.append("user")
+        await asyncio.sleep(0)
+        return copy.deepcopy(self.user_data)
+
+    async def read_home_data(self, home_id: str) -> dict[str, Any]:
+        self.reads.append(home_id)
+        await asyncio.sleep(0)
+        if home_id not in self.home_data:
+            raise ApiError(f"Unknown home {home_id}")
+        return copy.deepcopy(self.home_data[home_id])
+
+    async def write_query(self, home_id: str, query_params: dict[str, Any]):
+        self.writes.append((home_id, dict(query_params)))
+        if self.write_gate is not None:
+            await self.write_gate.wait()
+        else:
+            await asyncio.sleep(0)
+        if self.write_errors:
+            raise self.write_errors.pop(0)
+
+
+@pytest.fixture
+def api_session() -> FakeApiSession:
+    """A fake API session, for tests not calling the cloud API"""
+    return FakeApiSession()
+
+
+@pytest.fixture
+def radiator(api_session: FakeApiSession) -> Radiator:
+    """A radiator connected to the fake API session"""
+    data = api_session.home_data[HOME_ID]
+    home = HomeInfo(data=data)
+    return Radiator(api_session, home, copy.deepcopy(data["devices"]["0"]))
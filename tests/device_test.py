@@ -0,0 +1,259 @@
+import asyncio
+import gc
+import pytest
+
+from clevertouch import ApiError, Home
+from clevertouch.api import ApiConnectError
+from clevertouch.devices import Device, Radiator
+from clevertouch.devices.radiator import HeatMode
+
+from conftest import FakeApiSession, HOME_ID, radiator_data
+
+
+async def test_batch_sends_single_query(
+    api_session: FakeApiSession, radiator: Radiator
+):
+    """Test that changes in a batch are merged into a single query"""
+    async with radiator.batch():
+        await radiator.set_temperature("comfort", 20, "celsius")
+        await radiator.set_heat_mode(HeatMode.COMFORT)
+        assert not api_session.writes
+
+    assert api_session.writes == [
+        (
+            HOME_ID,
+            {
+                "id_device": "C1",
+                "consigne_confort": 680,
+                "gv_mode": "0",
+                "nv_mode": "0",
+            },
+        )
+    ]
+
+
+async def test_batch_updates_after_send(
+    api_session: FakeApiSession, radiator: Radiator
+):
+    """Test that the local state is updated only once the batch is sent"""
+    async with radiator.batch():
+        await radiator.set_temperature("comfort", 20, "celsius")
+        await radiator.set_heat_mode(HeatMode.COMFORT)
+        assert radiator.temperatures["comfort"].device == 650
+        assert radiator.heat_mode == HeatMode.ECO
+
+    assert radiator.temperatures["comfort"].device == 680
+    assert radiator.heat_mode == HeatMode.COMFORT
+
+
+async def test_batch_failed_send(api_session: FakeApiSession, radiator: Radiator):
+    """Test that the local state is kept when the batch can not be sent"""
+    api_session.write_errors.append(ApiConnectError("Connection error"))
+    with pytest.raises(ApiConnectError):
+        async with radiator.batch():
+            await radiator.set_heat_mode(HeatMode.COMFORT)
+
+    assert len(api_session.writes) == 1
+    assert radiator.heat_mode == HeatMode.ECO
+
+
+async def test_batch_body_raises(api_session: FakeApiSession, radiator: Radiator):
+    """Test that nothing is sent when the body of the batch raises"""
+    with pytest.raises(RuntimeError):
+        async with radiator.batch():
+            await radiator.set_heat_mode(HeatMode.COMFORT)
+            raise RuntimeError("Aborted")
+
+    assert not api_session.writes
+    assert radiator.heat_mode == HeatMode.ECO
+
+    # The device is usable again after the aborted batch
+    await radiator.set_heat_mode(HeatMode.COMFORT)
+    assert len(api_session.writes) == 1
+    assert radiator.heat_mode == HeatMode.COMFORT
+
+
+async def test_nested_batch(api_session: FakeApiSession, radiator: Radiator):
+    """Test that a batch can not be started within another batch"""
+    with pytest.raises(ApiError):
+        async with radiator.batch():
+            await radiator.set_heat_mode(HeatMode.COMFORT)
+            async with radiator.batch():
+                pass
+
+    assert not api_session.writes
+
+
+async def test_update_skips_identical_data(radiator: Radiator):
+    """Test that data identical to the previous update is skipped"""
+    radiator.label = "Changed locally"
+    radiator.update(radiator_data())
+    assert radiator.label == "Changed locally"
+
+    radiator.update(radiator_data(label_interface="Renamed"))
+    assert radiator.label == "Renamed"
+
+
+async def test_update_after_write(api_session: FakeApiSession, radiator: Radiator):
+    """Test that the update following a write is applied for identical data"""
+    await radiator.set_heat_mode(HeatMode.COMFORT)
+    assert radiator.heat_mode == HeatMode.COMFORT
+
+    radiator.update(radiator_data())
+    assert radiator.heat_mode == HeatMode.ECO
+
+
+async def test_zone_label_change(api_session: FakeApiSession):
+    """Test that a device follows a zone change when its data is unchanged"""
+    home = Home(api_session, HOME_ID)
+    await home.refresh()
+    device = home.devices["r1"]
+    assert device.zone.label == "Living room"
+
+    api_session.home_data[HOME_ID]["zones"]["0"]["zone_label"] = "Kitchen"
+    await home.refresh()
+    assert device.zone.label == "Kitchen"
+    assert device.zone is home.info.zones["1"]
+
+
+@pytest.fixture
+def no_retry_delay(monkeypatch: pytest.MonkeyPatch):
+    """Retry failed eager writes without waiting"""
+    monkeypatch.setattr(Device, "_WRITE_RETRY_DELAY", 0)
+
+
+async def test_eager_write(api_session: FakeApiSession, radiator: Radiator):
+    """Test that an eager write updates the local state before it is sent"""
+    api_session.write_gate = asyncio.Event()
+    task = await radiator.set_temperature(
+        "comfort", 20, "celsius", eager_local=True
+    )
+    assert radiator.temperatures["comfort"].device == 680
+    assert not task.done()
+
+    api_session.write_gate.set()
+    await task
+    assert len(api_session.writes) == 1
+    assert radiator.temperatures["comfort"].device == 680
+
+
+async def test_eager_write_retry(
+    api_session: FakeApiSession, radiator: Radiator, no_retry_delay
+):
+    """Test that an eager write is retried on connection errors"""
+    api_session.write_errors.extend(
+        [ApiConnectError("Connection error"), ApiConnectError("Connection error")]
+    )
+    task = await radiator.set_heat_mode(HeatMode.COMFORT, eager_local=True)
+    await task
+    assert len(api_session.writes) == 3
+    assert radiator.heat_mode == HeatMode.COMFORT
+
+
+async def test_eager_write_revert(
+    api_session: FakeApiSession, radiator: Radiator, no_retry_delay
+):
+    """Test that an eager write is reverted when it finally fails"""
+    api_session.write_errors.extend(
+        [ApiConnectError("Connection error")] * Device._WRITE_ATTEMPTS
+    )
+    task = await radiator.set_temperature(
+        "eco", 20, "celsius", eager_local=True
+    )
+    assert radiator.temperatures["target"].device == 680
+    with pytest.raises(ApiConnectError):
+        await task
+    assert len(api_session.writes) == Device._WRITE_ATTEMPTS
+    assert radiator.temperatures["eco"].device == 600
+    assert radiator.temperatures["target"].device == 600
+
+
+async def test_eager_write_revert_concurrent(
+    api_session: FakeApiSession, radiator: Radiator
+):
+    """Test that a failed eager write keeps changes of other writes"""
+    api_session.write_errors.append(ApiError("Write failed"))
+    temperature_task = await radiator.set_temperature(
+        "comfort", 20, "celsius", eager_local=True
+    )
+    heat_mode_task = await radiator.set_heat_mode(HeatMode.BOOST, eager_local=True)
+    with pytest.raises(ApiError):
+        await temperature_task
+    await heat_mode_task
+
+    assert radiator.temperatures["comfort"].device == 650
+    assert radiator.heat_mode == HeatMode.BOOST
+
+
+async def test_eager_write_revert_after_refresh(
+    api_session: FakeApiSession, radiator: Radiator
+):
+    """Test that a failed eager write keeps data refreshed while it was sent"""
+    api_session.write_gate = asyncio.Event()
+    api_session.write_errors.append(ApiError("Write failed"))
+    task = await radiator.set_temperature(
+        "comfort", 20, "celsius", eager_local=True
+    )
+    radiator.update(radiator_data(temperature_air="660", consigne_confort="670"))
+
+    api_session.write_gate.set()
+    with pytest.raises(ApiError):
+        await task
+    assert radiator.temperatures["current"].device == 660
+    assert radiator.temperatures["comfort"].device == 670
+
+    # The next refresh is applied, even for unchanged data
+    radiator.temperatures["comfort"] = radiator.temperatures["eco"]
+    radiator.update(radiator_data(temperature_air="660", consigne_confort="670"))
+    assert radiator.temperatures["comfort"].device == 670
+
+
+async def test_eager_write_in_batch(api_session: FakeApiSession, radiator: Radiator):
+    """Test that eager writes can not be used in a batch"""
+    with pytest.raises(ApiError):
+        async with radiator.batch():
+            await radiator.set_heat_mode(HeatMode.COMFORT, eager_local=True)
+
+    assert not api_session.writes
+    assert radiator.heat_mode == HeatMode.ECO
+
+
+async def test_batch_concurrent_write(api_session: FakeApiSession, radiator: Radiator):
+    """Test that writes from other tasks are not collected by a batch"""
+    batch_open = asyncio.Event()
+    write_done = asyncio.Event()
+
+    async def write_in_batch():
+        async with radiator.batch():
+            await radiator.set_temperature("comfort", 20, "celsius")
+            batch_open.set()
+            await write_done.wait()
+            raise RuntimeError("Aborted")
+
+    batch_task = asyncio.ensure_future(write_in_batch())
+    await batch_open.wait()
+    await radiator.set_heat_mode(HeatMode.OFF)
+    assert api_session.writes == [
+        (HOME_ID, {"id_device": "C1", "gv_mode": "1", "nv_mode": "1"})
+    ]
+    assert radiator.heat_mode == HeatMode.OFF
+
+    write_done.set()
+    with pytest.raises(RuntimeError):
+        await batch_task
+    assert len(api_session.writes) == 1
+
+
+async def test_eager_write_dropped_task(
+    api_session: FakeApiSession, radiator: Radiator, caplog: pytest.LogCaptureFixture
+):
+    """Test that the error of an eager write is logged when not awaited"""
+    api_session.write_errors.append(ApiError("Write failed"))
+    task = await radiator.set_heat_mode(HeatMode.COMFORT, eager_local=True)
+    await asyncio.wait([task])
+    del task
+    gc.collect()
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert "Write to device r1 failed: Write failed" in messages
+    assert not any("never retrieved" in message for message in messages)